@@ -5,18 +5,27 @@ Exploring ideas for ESoWC project:
 https://github.com/dvalters/fuse-netcdf
 """
 
+import io
 import os
 import sys
 import netCDF4 as ncpy
 import re
 import time
+import threading
 import numpy
-import inspect
 import argparse
+import cachetools
 import logging as log
 from fuse import FUSE, FuseOSError, Operations
 from errno import EACCES, ENOENT
 
+# pandas is optional; when present, its C-level float formatter is
+# used to speed up text serialization of variable data
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
 
 class InternalError(Exception):
     pass
@@ -43,6 +52,17 @@ def memoize(function):
     return wrapper
 
 
+def locked(method):
+    """
+    Decorator serializing method calls through the
+    instance's _lock attribute.
+    """
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 def write_to_string(string, buf, offset):
     """
     Implements someting like string[offset:offset+len(buf)] = buf
@@ -66,29 +86,100 @@ class VardataAsBinaryFiles(object):
 
     def size(self, variable):
         """ Return size (in bytes) of data representation """
-        return len(self(variable))
+        return self(variable).nbytes
 
-    @memoize
     def __call__(self, variable):
         """ Return Variable's data representation """
-        data = variable[:].tobytes()
-        return data
+        # expose the array's buffer directly instead of copying it
+        # out with tobytes(); only non-contiguous arrays are copied
+        arr = variable[:]
+        if not arr.flags.c_contiguous:
+            arr = numpy.ascontiguousarray(arr)
+        return memoryview(arr).cast('B')
 
 
 class VardataAsFlatTextFiles(object):
 
+    # values probed in __init__ to decide whether a format produces
+    # fixed-width output for any input
+    _PROBE_VALUES = (0.0, -0.0, 1.5, -1.5, 1e300, -1e-300,
+                     float('nan'), float('inf'), float('-inf'))
+
     def __init__(self, fmt='%f'):
         self._fmt = fmt
+        widths = {len(fmt % value) for value in self._PROBE_VALUES}
+        if len(widths) == 1:
+            # width of one formatted element, including the newline
+            self._elem_width = widths.pop() + 1
+        else:
+            self._elem_width = None
 
     def size(self, variable):
-        """ Return size (in bytes) of data representation """
+        """ Return size (in bytes) of data representation.
+            For fixed-width formats the size is computed analytically,
+            without materializing the representation.
+        """
+        if self._elem_width is not None:
+            nelems = int(numpy.prod(variable.shape, dtype=numpy.int64))
+            return nelems * self._elem_width
         return len(self(variable))
 
-    @memoize
     def __call__(self, variable):
         """ Return Variable's data representation """
-        return ''.join(numpy.char.mod(
-            '{}\n'.format(self._fmt), variable[:].flatten()))
+        arr = numpy.ascontiguousarray(variable[:]).ravel()
+        if (pandas is not None and arr.dtype.kind == 'f'
+                and not numpy.ma.isMaskedArray(arr)):
+            # fast path: pandas formats floats in C; NaN must render
+            # exactly as the %-formatted value so that the output
+            # width agrees with size() and read_slice()
+            try:
+                buf = io.StringIO()
+                pandas.Series(arr).to_csv(
+                        buf, header=False, index=False,
+                        float_format=self._fmt,
+                        na_rep=self._fmt % float('nan'),
+                        lineterminator='\n')
+                return buf.getvalue().encode()
+            except TypeError:
+                # pandas < 1.5 does not know lineterminator=;
+                # fall through to the numpy path
+                pass
+        lines = numpy.char.add(numpy.char.mod(self._fmt, arr), '\n')
+        widths = numpy.char.str_len(lines)
+        if widths.size and (widths == widths[0]).all():
+            # all lines have the same width, so the array can be
+            # re-encoded as a fixed-stride bytes array and dumped as
+            # one contiguous buffer, without a Python-level join
+            return lines.astype('S{}'.format(widths[0])).tobytes()
+        return ''.join(lines.tolist()).encode()
+
+    def can_read_slice(self, variable):
+        """ Test if read_slice() can serve this variable; requires a
+            fixed-width format and a non-scalar variable """
+        return self._elem_width is not None and len(variable.shape) > 0
+
+    def read_slice(self, variable, offset, size):
+        """ Return the [offset:offset+size) byte range of the data
+            representation, reading and formatting only the elements
+            that overlap it. Peak memory is O(size) instead of O(N).
+        """
+        width = self._elem_width
+        start_elem = offset // width
+        stop_elem = -(-(offset + size) // width)
+        # read only the rows (slices along the first dimension)
+        # overlapping the requested element range
+        row_elems = 1
+        for n in variable.shape[1:]:
+            row_elems *= n
+        start_row = start_elem // row_elems
+        stop_row = min(-(-stop_elem // row_elems), variable.shape[0])
+        arr = numpy.ascontiguousarray(variable[start_row:stop_row]).ravel()
+        first_elem = start_row * row_elems
+        arr = arr[start_elem - first_elem:stop_elem - first_elem]
+        lines = numpy.char.add(numpy.char.mod(self._fmt, arr), '\n')
+        buf = lines.astype('S{}'.format(width)).tobytes()
+        skip = offset - start_elem * width
+        return buf[skip:skip + size]
 
 
 class AttributesAsTextFiles(object):
@@ -113,19 +204,160 @@ class AttributesAsTextFiles(object):
 # NetCDF filesystem implementation
 #
 
+# path kinds, as stored in the NCFS path map and
+# returned by NCFS._classify()
+ROOT = 'root'
+VAR_DIR = 'var_dir'
+VAR_DATA = 'var_data'
+VAR_DIMS = 'var_dims'
+VAR_ATTR = 'var_attr'
+
+
 class NCFS(object):
     """
     Main object for netCDF-filesytem operations
     """
+
+    # special files/directories created by desktop environments and
+    # indexers, which should never reach the dataset
+    _BLACKLIST = re.compile(
+            r'(^|/)\.(Trash|DS_Store|Spotlight-V100|fseventsd)(\b|/|-)')
+
     def __init__(self, dataset, vardata_repr, attr_repr):
         self.dataset = dataset
+        # serializes access to the caches and to the netCDF library
+        # (neither cachetools nor HDF5 is thread-safe) when FUSE
+        # dispatches callbacks from multiple threads
+        self._lock = threading.RLock()
         # plugin for generating Variable's data representations
         self.vardata_repr = vardata_repr
         # plugin for generation Atributes representations
         self.attr_repr = attr_repr
+        # cache of Variable data representations; FUSE calls
+        # getattr/read many times per file, so generate the
+        # representation once and reuse it
+        self._repr_cache = cachetools.LRUCache(maxsize=16)
+        # cache of raw Variable contents; each variable[:] hits
+        # libnetcdf and decompresses the whole variable from disk,
+        # so do it at most once per variable
+        self._var_array_cache = cachetools.LRUCache(maxsize=8)
+        # cache of getattr() results; FUSE issues a getattr before
+        # almost every operation, so avoid re-deriving the stat dict
+        # on every call
+        self._attr_cache = cachetools.TTLCache(maxsize=4096, ttl=60)
+        # precomputed map from known paths to (kind, varname, attrname)
+        # tuples, so that the hot FUSE callbacks do a single dict lookup
+        # instead of re-running the regex predicates on every call
+        self._path_kind = {'/': (ROOT, None, None)}
+        # snapshot of the dataset structure taken at mount time, so
+        # that lookups do not call into netCDF4 on every FUSE op;
+        # kept in sync by set_var_attr()/del_var_attr()
+        self._vars = {}
+        self._attr_names = {}
+        self._attrs = {}
+        # bytes representations of attribute values, keyed by
+        # (varname, attrname); attributes are tiny and immutable
+        # between writes, so keep them all rendered
+        self._attr_bytes_cache = {}
+        # precomputed readdir listings; kept in sync when attributes
+        # are created or deleted through the filesystem
+        self._readdir_root = ['.', '..']
+        self._readdir_var = {}
+        if dataset is not None:
+            for varname, var in dataset.variables.items():
+                self._map_var_paths(varname, var)
+            if vardata_repr is not None:
+                self._prewarm_repr_cache()
         # store mount time, for file timestamps
         self.mount_time = time.time()
 
+    # variables whose representation is estimated to stay below this
+    # size are materialized eagerly at mount time
+    _PREWARM_LIMIT = 65536
+
+    def _prewarm_repr_cache(self):
+        """ Materialize data representations of small variables
+            up-front, so their first read is served from a warm
+            cache instead of paying the formatting cost inline """
+        for varname, var in self.dataset.variables.items():
+            try:
+                nelems = int(numpy.prod(var.shape, dtype=numpy.int64))
+            except AttributeError:
+                continue
+            # ~16 bytes per element is a safe upper estimate for both
+            # the text and the binary representations
+            if nelems * 16 > self._PREWARM_LIMIT:
+                continue
+            try:
+                self._vardata_bytes(varname)
+            except Exception:
+                # representation will be attempted again (and the
+                # error surfaced) when the file is actually read
+                log.debug('prewarm failed for variable %s', varname)
+
+    def _map_var_paths(self, varname, var):
+        """ Add all paths belonging to a Variable to the path map,
+            snapshot its attributes and precompute its directory
+            listing """
+        try:
+            attrnames = var.ncattrs()
+        except AttributeError:
+            # not a real netCDF Variable (e.g. a test fake)
+            attrnames = []
+        self._vars[varname] = var
+        self._attr_names[varname] = list(attrnames)
+        for attrname in attrnames:
+            value = var.getncattr(attrname)
+            self._attrs[(varname, attrname)] = value
+            if self.attr_repr is not None:
+                self._attr_bytes_cache[(varname, attrname)] = \
+                    self.attr_repr(value).encode()
+            path = '/{}/{}'.format(varname, attrname)
+            self._path_kind[path] = (VAR_ATTR, varname, attrname)
+        self._path_kind['/' + varname] = (VAR_DIR, varname, None)
+        self._path_kind['/{}/DATA_REPR'.format(varname)] = \
+            (VAR_DATA, varname, None)
+        self._path_kind['/{}/dimensions'.format(varname)] = \
+            (VAR_DIMS, varname, None)
+        self._readdir_root.append(varname.encode('utf-8'))
+        self._readdir_var[varname] = \
+            ['.', '..'] + list(attrnames) + ['DATA_REPR']
+
+    def _classify(self, path):
+        """ Return (kind, varname, attrname) for a path, or
+            (None, None, None) if it matches no existing object.
+        """
+        entry = self._path_kind.get(path)
+        if entry is not None:
+            return entry
+        # not known at mount time; only attributes can appear
+        # dynamically, anything else is a miss
+        if self.is_var_attr(path) and self.get_var_attr(path) is not None:
+            varname, attrname = self._parse(path)
+            entry = (VAR_ATTR, varname, attrname)
+            self._path_kind[path] = entry
+            return entry
+        return (None, None, None)
+
+    def _get_array(self, varname):
+        """ Return (possibly cached) contents of a Variable as a
+            contiguous numpy array """
+        arr = self._var_array_cache.get(varname)
+        if arr is None:
+            arr = numpy.ascontiguousarray(self.dataset.variables[varname][:])
+            self._var_array_cache[varname] = arr
+        return arr
+
+    def _vardata_bytes(self, varname):
+        """ Return (possibly cached) data representation of a Variable,
+            wrapped in a memoryview so that slicing it is zero-copy.
+        """
+        buf = self._repr_cache.get(varname)
+        if buf is None:
+            buf = memoryview(self.vardata_repr(self._get_array(varname)))
+            self._repr_cache[varname] = buf
+        return buf
+
     def is_var_dir(self, path):
         """ Test if path is a valid Variable directory path """
         return re.search('^/[^/]+$', path) is not None
@@ -144,7 +376,7 @@ class NCFS(object):
 
     def is_var_attr(self, path):
         """ Test if path is a valid path for Variable's Attribute """
-        if '.Trash' in path:
+        if self.is_blacklisted(path):
             return False
         if re.search('^/[^/]+/[^/]+$', path) is not None:
             return not (self.is_var_data(path) or self.is_var_dimensions(path))
@@ -168,33 +400,49 @@ class NCFS(object):
 
     def is_blacklisted(self, path):
         """ Test if a special file/directory """
-        return '.Trash' in path
+        return self._BLACKLIST.search(path) is not None
 
     def is_file(self, path):
         """ Test if path corresponds to a file-like object """
         return not self.is_dir(path)
 
+    def _parse(self, path):
+        """ Split a path into (varname, attrname) components with a
+            single pass; either component may be '' when absent """
+        varname, _, attrname = path[1:].partition('/')
+        return varname, attrname
+
     def get_varname(self, path):
         """
         Return NetCDF variable name, given its path.
         The path can be variable, attribute, data repr or dimensions path
         """
-        return path.lstrip('/').split('/', 1)[0]
+        return self._parse(path)[0]
 
     def get_attrname(self, path):
         """ Return attribute name, given its path """
-        return path.split('/')[-1]
+        return self._parse(path)[1]
+
+    def _get_var(self, varname):
+        """ Return NetCDF Variable object, given its name, or None """
+        var = self._vars.get(varname)
+        if var is None:
+            var = self.dataset.variables.get(varname, None)
+        return var
 
     def get_variable(self, path):
         """ Return NetCDF Variable object, given its path, or None """
-        varname = self.get_varname(path)
-        return self.dataset.variables.get(varname, None)
+        return self._get_var(self._parse(path)[0])
 
-    def get_var_attr(self, path):
-        """ Return NetCDF Attribute object, given its path, or None """
-        varname = self.get_varname(path)
-        attrname = self.get_attrname(path)
-        var = self.dataset.variables.get(varname, None)
+    def _get_attr(self, varname, attrname):
+        """ Return an Attribute value, given its parsed components,
+            or None """
+        try:
+            return self._attrs[(varname, attrname)]
+        except KeyError:
+            pass
+        # not snapshotted (e.g. a test fake); ask netCDF4 directly
+        var = self._get_var(varname)
         if var is None:
             return None
         try:
@@ -202,25 +450,54 @@ class NCFS(object):
         except AttributeError:
             return None
 
+    def get_var_attr(self, path):
+        """ Return NetCDF Attribute object, given its path, or None """
+        varname, attrname = self._parse(path)
+        return self._get_attr(varname, attrname)
+
+    def _attr_bytes(self, varname, attrname):
+        """ Return (possibly cached) bytes representation of an
+            attribute value """
+        key = (varname, attrname)
+        buf = self._attr_bytes_cache.get(key)
+        if buf is None:
+            buf = self.attr_repr(self._get_attr(varname, attrname)).encode()
+            self._attr_bytes_cache[key] = buf
+        return buf
+
     def set_var_attr(self, path, value):
         """
         Set value of an attribute, given it's path.
         If attribute doesn't exist it will be created.
         """
-        attrname = self.get_attrname(path)
-        var = self.get_variable(path)
+        varname, attrname = self._parse(path)
+        var = self._get_var(varname)
         var.setncattr(attrname, value)
+        # keep the structure snapshot in sync
+        self._attrs[(varname, attrname)] = value
+        self._attr_bytes_cache.pop((varname, attrname), None)
+        names = self._attr_names.setdefault(varname, [])
+        if attrname not in names:
+            names.append(attrname)
 
     def del_var_attr(self, path):
-        attrname = self.get_attrname(path)
-        var = self.get_variable(path)
+        varname, attrname = self._parse(path)
+        var = self._get_var(varname)
         var.delncattr(attrname)
+        # keep the structure snapshot in sync
+        self._attrs.pop((varname, attrname), None)
+        self._attr_bytes_cache.pop((varname, attrname), None)
+        names = self._attr_names.get(varname)
+        if names is not None and attrname in names:
+            names.remove(attrname)
 
     def getncAttrs(self, path):
         """ Return name of NetCDF attributes, given variable's path """
         varname = self.get_varname(path)
-        attrs = self.dataset.variables[varname].ncattrs()
-        return [attr for attr in attrs]
+        names = self._attr_names.get(varname)
+        if names is None:
+            names = self.dataset.variables[varname].ncattrs()
+        return list(names)
 
     @classmethod
     def makeIntoDir(cls, statdict):
@@ -233,6 +510,7 @@ class NCFS(object):
                 statdict["st_mode"] = statdict["st_mode"] | i[1]
         return statdict
 
+    @locked
     def getattr(self, path):
         """The getattr callback is in charge of reading the metadata of a
             given path, this callback is always called before any operation
@@ -246,6 +524,9 @@ class NCFS(object):
         to 1. Files also require that the st_size (the full file size) is
         specified.
         """
+        cached = self._attr_cache.get(path)
+        if cached is not None:
+            return cached.copy()
         # default attributes, correspond to a regular file
         statdict = dict(
                 st_atime=self.mount_time,
@@ -256,25 +537,30 @@ class NCFS(object):
                 st_nlink=1,
                 st_size=4096,
                 st_uid=os.getuid())
-        if path == "/":
-            statdict = self.makeIntoDir(statdict)
-        elif self.is_blacklisted(path):
+        if self.is_blacklisted(path):
             return statdict
-        elif not self.exists(path):
-            log.debug('getattr: %s does not exist' % path)
+        kind, varname, attrname = self._classify(path)
+        if kind is None:
+            log.debug('getattr: %s does not exist', path)
             raise FuseOSError(ENOENT)
-        elif self.is_var_dir(path):
+        elif kind == ROOT:
+            statdict = self.makeIntoDir(statdict)
+        elif kind == VAR_DIR:
             statdict = self.makeIntoDir(statdict)
             statdict["st_size"] = 4096
-        elif self.is_var_attr(path):
-            attr = self.get_var_attr(path)
-            statdict["st_size"] = self.attr_repr.size(attr)
-        elif self.is_var_data(path):
-            var = self.get_variable(path)
-            statdict["st_size"] = self.vardata_repr.size(var)
-        else:
-            # this should never happen
-            raise InternalError('getattr: unexpected path {}'.format(path))
+        elif kind == VAR_ATTR:
+            statdict["st_size"] = len(self._attr_bytes(varname, attrname))
+        elif kind == VAR_DATA:
+            var = self._get_var(varname)
+            if (hasattr(self.vardata_repr, 'can_read_slice') and
+                    self.vardata_repr.can_read_slice(var)):
+                # cheap analytic size; avoids materializing the
+                # whole representation just to stat the file
+                statdict["st_size"] = self.vardata_repr.size(var)
+            else:
+                statdict["st_size"] = len(self._vardata_bytes(varname))
+        # VAR_DIMS keeps the default regular-file attributes
+        self._attr_cache[path] = statdict
         return statdict
 
     def getxattr(self, name):
@@ -284,21 +570,17 @@ class NCFS(object):
     def removexattr(self, name):
         return 0
 
+    @locked
     def readdir(self, path):
         """Overrides readdir.
         Called when ls or ll and any other unix command that relies
         on this operation to work.
         """
-        path = path.lstrip("/")
-        if path == "":
-            # Return a list of netCDF variables
-            return (['.', '..'] + [item.encode('utf-8')
-                    for item in self.dataset.variables])
-        elif path in self.dataset.variables:
-            local_attrs = self.getncAttrs(path)
-            return ['.', '..'] + local_attrs + ["DATA_REPR"]
-        else:
-            return ['.', '..']
+        varname = path.lstrip("/")
+        if varname == "":
+            # list of netCDF variables
+            return self._readdir_root
+        return self._readdir_var.get(varname, ['.', '..'])
 
     def access(self, mode):
         if self.dataset_file is not None:
@@ -314,35 +596,64 @@ class NCFS(object):
             return ENOENT
         return 0
 
+    @locked
     def read(self, path, size, offset):
-        if self.is_var_attr(path):
-            attr = self.get_var_attr(path)
-            return self.attr_repr(attr)[offset:offset+size]
-        elif self.is_var_data(path):
-            var = self.get_variable(path)
-            return self.vardata_repr(var)[offset:offset+size]
+        kind, varname, attrname = self._classify(path)
+        if kind == VAR_ATTR:
+            return self._attr_bytes(varname, attrname)[offset:offset+size]
+        elif kind == VAR_DATA:
+            # if the representation is not materialized yet and the
+            # plugin can format arbitrary byte ranges on demand, serve
+            # the read without building the whole representation
+            if (varname not in self._repr_cache and
+                    hasattr(self.vardata_repr, 'can_read_slice')):
+                var = self._var_array_cache.get(varname)
+                if var is None:
+                    var = self._get_var(varname)
+                if self.vardata_repr.can_read_slice(var):
+                    return self.vardata_repr.read_slice(var, offset, size)
+            # slicing the memoryview is zero-copy; only the final
+            # conversion to bytes (required by fusepy) copies
+            return bytes(self._vardata_bytes(varname)[offset:offset+size])
         else:
             raise InternalError('read(): unexpected path %s' % path)
 
+    @locked
     def create(self, path, mode):
         if self.is_var_attr(path):
             self.set_var_attr(path, '')
+            varname, attrname = self._parse(path)
+            self._path_kind[path] = (VAR_ATTR, varname, attrname)
+            listing = self._readdir_var.get(varname)
+            if listing is not None and attrname not in listing:
+                # keep DATA_REPR as the last entry
+                listing.insert(len(listing) - 1, attrname)
+            self._attr_cache.pop(path, None)
         else:
             raise InternalError('create(): unexpected path %s' % path)
         return 0
 
+    @locked
     def write(self, path, buf, offset, fh=0):
         if self.is_var_attr(path):
             attr = self.get_var_attr(path)
             attr = write_to_string(attr, buf, offset)
             self.set_var_attr(path, attr)
+            self._attr_cache.pop(path, None)
             return len(buf)
         else:
             raise InternalError('write(): unexpected path %s' % path)
 
+    @locked
     def unlink(self, path):
         if self.is_var_attr(path):
             self.del_var_attr(path)
+            self._path_kind.pop(path, None)
+            varname, attrname = self._parse(path)
+            listing = self._readdir_var.get(varname)
+            if listing is not None and attrname in listing:
+                listing.remove(attrname)
+            self._attr_cache.pop(path, None)
         else:
             raise InternalError('unlink(): unexpected path %s' % path)
         return 0
@@ -355,22 +666,25 @@ class NCFSOperations(Operations):
     """Inherit from the base fusepy Operations class"""
 
     def __getattribute__(self, name):
-        """ Intercept and print all method calls """
+        """ Intercept and log all method calls.
+            When debug logging is disabled the method is returned
+            undecorated, so FUSE callbacks pay no logging overhead
+            (building reprs of large buffers is expensive).
+        """
         attr = object.__getattribute__(self, name)
-        if hasattr(attr, '__call__'):
-            def newfunc(*args, **kwargs):
-                func_args = [repr(x) for x in args]
-                func_kwargs = ['{}={}'.format(k, repr(v)) for k, v in kwargs]
-                func_args.extend(func_kwargs)
-                # print  name of the function and argument values
-                log.debug('{}({})'.format(name, ', '.join(func_args)))
-                result = attr(*args, **kwargs)
-                # print return value
-                # log.debug('{}() returned {}'.format(name, repr(result)))
-                return result
-            return newfunc
-        else:
+        if not hasattr(attr, '__call__'):
             return attr
+        if not log.getLogger().isEnabledFor(log.DEBUG):
+            return attr
+
+        def newfunc(*args, **kwargs):
+            func_args = [repr(x) for x in args]
+            func_args.extend(
+                '{}={!r}'.format(k, v) for k, v in kwargs.items())
+            # log name of the function and argument values
+            log.debug('%s(%s)', name, ', '.join(func_args))
+            return attr(*args, **kwargs)
+        return newfunc
 
     def __init__(self, ncfs):
         self.ncfs = ncfs
@@ -513,7 +827,22 @@ def main():
     # create FUSE Operations (does it need to be a separate class?)
     ncfs_operations = NCFSOperations(ncfs)
     # launch!
-    FUSE(ncfs_operations, cmdline.mountpoint, nothreads=True, foreground=True)
+    # big_writes / max_read / max_readahead let the kernel batch I/O
+    # into 4MB requests instead of the default 128KB, cutting the
+    # number of userspace round trips per large DATA_REPR read;
+    # kernel_cache/auto_cache keep page-cache contents between opens
+    # (the dataset only changes through this filesystem). Readahead
+    # beyond the default may additionally need kernel tuning (e.g.
+    # the bdi read_ahead_kb sysfs knob).
+    # attr_timeout/entry_timeout let the kernel cache stat results
+    # and dentries, skipping most userspace getattr calls; attribute
+    # writes through this filesystem may take up to attr_timeout to
+    # be reflected in cached stats, which is acceptable for a mostly
+    # read-only mount
+    FUSE(ncfs_operations, cmdline.mountpoint, nothreads=False,
+         foreground=True, big_writes=True, max_read=4194304,
+         max_readahead=4194304, kernel_cache=True, auto_cache=True,
+         attr_timeout=60, entry_timeout=60, negative_timeout=10)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,10 @@
 import unittest
+import numpy
 from fusenetcdf.fusenetcdf import NCFS
+from fusenetcdf.fusenetcdf import AttributesAsTextFiles
+from fusenetcdf.fusenetcdf import VardataAsBinaryFiles
+from fusenetcdf.fusenetcdf import VardataAsFlatTextFiles
+from fusenetcdf.fusenetcdf import ROOT, VAR_DIR, VAR_DATA, VAR_ATTR
 from netCDF4 import Dataset
 
 
@@ -60,6 +65,24 @@ class TestIsVarAttribute(unittest.TestCase):
         self.assertFalse(self.ncfs.is_var_attr('/abcd/dimensions'))
 
 
+class TestIsBlacklisted(unittest.TestCase):
+
+    def setUp(self):
+        self.ncfs = NCFS(None, None, None)
+
+    def test_trash_dir(self):
+        self.assertTrue(self.ncfs.is_blacklisted('/.Trash'))
+
+    def test_trash_dir_with_uid(self):
+        self.assertTrue(self.ncfs.is_blacklisted('/.Trash-1000/files'))
+
+    def test_ds_store(self):
+        self.assertTrue(self.ncfs.is_blacklisted('/abcd/.DS_Store'))
+
+    def test_regular_path(self):
+        self.assertFalse(self.ncfs.is_blacklisted('/abcd/def'))
+
+
 class FakeVariable(object):
     def getncattr(self, name):
         if name == 'fooattr':
@@ -133,3 +156,220 @@ class TestWrite(unittest.TestCase):
         self.assertRaises(AttributeError,
                           self.ds.variables['foovar'].getncattr,
                           'foovar')
+
+
+class TestClassify(unittest.TestCase):
+
+    def setUp(self):
+        self.ds = create_test_dataset_1()
+        self.ncfs = NCFS(self.ds, None, None)
+
+    def tearDown(self):
+        self.ds.close()
+
+    def test_classify_root(self):
+        self.assertEqual(self.ncfs._classify('/'), (ROOT, None, None))
+
+    def test_classify_var_dir(self):
+        self.assertEqual(self.ncfs._classify('/foovar'),
+                         (VAR_DIR, 'foovar', None))
+
+    def test_classify_var_data(self):
+        self.assertEqual(self.ncfs._classify('/foovar/DATA_REPR'),
+                         (VAR_DATA, 'foovar', None))
+
+    def test_classify_var_attr(self):
+        self.assertEqual(self.ncfs._classify('/foovar/fooattr'),
+                         (VAR_ATTR, 'foovar', 'fooattr'))
+
+    def test_classify_unknown_path(self):
+        self.assertEqual(self.ncfs._classify('/foovar/nosuchattr'),
+                         (None, None, None))
+
+    def test_classify_attr_created_at_runtime(self):
+        self.ncfs.create('/foovar/newattr', mode=int('0100644', 8))
+        self.assertEqual(self.ncfs._classify('/foovar/newattr'),
+                         (VAR_ATTR, 'foovar', 'newattr'))
+
+
+class TestReaddir(unittest.TestCase):
+
+    def setUp(self):
+        self.ds = create_test_dataset_1()
+        self.ncfs = NCFS(self.ds, None, None)
+
+    def tearDown(self):
+        self.ds.close()
+
+    def test_readdir_root(self):
+        self.assertEqual(self.ncfs.readdir('/'),
+                         ['.', '..', b'foovar'])
+
+    def test_readdir_var_dir(self):
+        self.assertEqual(self.ncfs.readdir('/foovar'),
+                         ['.', '..', 'fooattr', 'DATA_REPR'])
+
+    def test_readdir_unknown_dir(self):
+        self.assertEqual(self.ncfs.readdir('/nosuchvar'), ['.', '..'])
+
+    def test_readdir_after_attr_create(self):
+        self.ncfs.create('/foovar/newattr', mode=int('0100644', 8))
+        self.assertEqual(self.ncfs.readdir('/foovar'),
+                         ['.', '..', 'fooattr', 'newattr', 'DATA_REPR'])
+
+    def test_readdir_after_attr_delete(self):
+        self.ncfs.unlink('/foovar/fooattr')
+        self.assertEqual(self.ncfs.readdir('/foovar'),
+                         ['.', '..', 'DATA_REPR'])
+
+
+class TestVardataAsFlatTextFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.ds = create_test_dataset_1()
+        self.ds.variables['foovar'][:] = 0.0
+        self.vardata_repr = VardataAsFlatTextFiles(fmt='%f')
+
+    def tearDown(self):
+        self.ds.close()
+
+    def test_one_line_per_element(self):
+        data = self.vardata_repr(self.ds.variables['foovar'])
+        self.assertEqual(data, b'0.000000\n' * 9)
+
+    def test_size_matches_repr(self):
+        var = self.ds.variables['foovar']
+        self.assertEqual(self.vardata_repr.size(var),
+                         len(self.vardata_repr(var)))
+
+    def test_lines_of_different_widths(self):
+        var = self.ds.variables['foovar']
+        var[0, 0] = -1.5
+        self.assertEqual(self.vardata_repr(var),
+                         b'-1.500000\n' + b'0.000000\n' * 8)
+
+
+class TestVardataAsBinaryFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.ds = create_test_dataset_1()
+        var = self.ds.variables['foovar']
+        var[:] = numpy.arange(9.0).reshape(3, 3)
+        self.var = var
+        self.vardata_repr = VardataAsBinaryFiles()
+
+    def tearDown(self):
+        self.ds.close()
+
+    def test_repr_matches_raw_bytes(self):
+        self.assertEqual(bytes(self.vardata_repr(self.var)),
+                         self.var[:].tobytes())
+
+    def test_size_matches_repr(self):
+        self.assertEqual(self.vardata_repr.size(self.var),
+                         len(bytes(self.vardata_repr(self.var))))
+
+
+class TestReadSlice(unittest.TestCase):
+
+    def setUp(self):
+        self.ds = create_test_dataset_1()
+        var = self.ds.variables['foovar']
+        var[:] = numpy.arange(9.0).reshape(3, 3)
+        self.var = var
+        self.vardata_repr = VardataAsFlatTextFiles(fmt='%15.6e')
+
+    def tearDown(self):
+        self.ds.close()
+
+    def test_variable_width_fmt_cannot_be_sliced(self):
+        self.assertFalse(
+            VardataAsFlatTextFiles(fmt='%f').can_read_slice(self.var))
+
+    def test_fixed_width_fmt_can_be_sliced(self):
+        self.assertTrue(self.vardata_repr.can_read_slice(self.var))
+
+    def test_analytic_size_matches_repr(self):
+        self.assertEqual(self.vardata_repr.size(self.var),
+                         len(self.vardata_repr(self.var)))
+
+    def test_nan_rendered_at_fixed_width(self):
+        self.var[1, 1] = float('nan')
+        full = self.vardata_repr(self.var)
+        self.assertEqual(self.vardata_repr.size(self.var), len(full))
+        for offset in (0, 60, 70):
+            self.assertEqual(
+                self.vardata_repr.read_slice(self.var, offset, 32),
+                full[offset:offset + 32])
+
+    def test_read_slice_matches_full_repr(self):
+        full = self.vardata_repr(self.var)
+        for offset in (0, 1, 15, 16, 17, 100, len(full) - 1):
+            for size in (1, 16, 40, len(full)):
+                self.assertEqual(
+                    self.vardata_repr.read_slice(self.var, offset, size),
+                    full[offset:offset + size])
+
+
+class TestAttrRead(unittest.TestCase):
+
+    def setUp(self):
+        self.ds = create_test_dataset_1()
+        self.ncfs = NCFS(self.ds, None, AttributesAsTextFiles())
+
+    def tearDown(self):
+        self.ds.close()
+
+    def test_read_attr(self):
+        self.assertEqual(self.ncfs.read('/foovar/fooattr', size=10, offset=0),
+                         b'abc\n')
+
+    def test_read_attr_slice(self):
+        self.assertEqual(self.ncfs.read('/foovar/fooattr', size=2, offset=1),
+                         b'bc')
+
+    def test_read_attr_after_write(self):
+        self.ncfs.write('/foovar/fooattr', 'xyz', offset=0)
+        self.assertEqual(self.ncfs.read('/foovar/fooattr', size=10, offset=0),
+                         b'xyz\n')
+
+
+class CountingVardataRepr(object):
+    """ Fake vardata representation plugin which counts invocations """
+
+    def __init__(self):
+        self.ncalls = 0
+
+    def size(self, variable):
+        return len(self(variable))
+
+    def __call__(self, variable):
+        self.ncalls += 1
+        return b'fake data repr'
+
+
+class TestVardataCache(unittest.TestCase):
+
+    def setUp(self):
+        self.ds = create_test_dataset_1()
+        self.vardata_repr = CountingVardataRepr()
+        self.ncfs = NCFS(self.ds, self.vardata_repr, None)
+
+    def tearDown(self):
+        self.ds.close()
+
+    def test_repr_generated_only_once(self):
+        self.ncfs._vardata_bytes('foovar')
+        self.ncfs._vardata_bytes('foovar')
+        self.assertEqual(self.vardata_repr.ncalls, 1)
+
+    def test_small_variable_prewarmed_at_mount(self):
+        # foovar is tiny, so its representation is generated during
+        # NCFS construction already
+        self.assertEqual(self.vardata_repr.ncalls, 1)
+        self.ncfs.read('/foovar/DATA_REPR', size=4, offset=0)
+        self.assertEqual(self.vardata_repr.ncalls, 1)
+
+    def test_read_returns_cached_repr(self):
+        data = self.ncfs.read('/foovar/DATA_REPR', size=4, offset=0)
+        self.assertEqual(data, b'fake')